@@ -1,6 +1,13 @@
+import os
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _version
 
+# Prefer the upb (C) protobuf backend over the pure-Python one; proto
+# serialization dominates registry operations and the pure-Python runtime is
+# an order of magnitude slower. Must be set before any *_pb2 module is
+# imported, and setdefault keeps an explicit user override intact.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 from feast.infra.offline_stores.bigquery_source import BigQuerySource
 from feast.infra.offline_stores.contrib.athena_offline_store.athena_source import (
     AthenaSource,
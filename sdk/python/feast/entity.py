@@ -11,20 +11,42 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import warnings
+import json
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set
 
-from google.protobuf.json_format import MessageToJson
 from typeguard import typechecked
 
 from feast.protos.feast.core.Entity_pb2 import Entity as EntityProto
-from feast.protos.feast.core.Entity_pb2 import EntityMeta as EntityMetaProto
 from feast.protos.feast.core.Entity_pb2 import EntitySpecV2 as EntitySpecProto
 from feast.value_type import ValueType
 
+# Entity names for which the missing value_type deprecation warning has already
+# been emitted, so repeated construction of the same entity (e.g. on registry
+# refreshes) does not spam logs or pay the warning machinery on every call.
+_warned_value_type_missing: Set[str] = set()
 
-@typechecked
+# Looking up an enum member through EnumMeta.__call__ is costly on the proto
+# deserialization path; index the members by proto number once instead.
+_VALUE_TYPES_BY_NUMBER: Dict[int, ValueType] = {
+    value_type.value: value_type for value_type in ValueType
+}
+
+# Under `python -O`, skip typeguard instrumentation on this hot class; the
+# runtime checks only guard against caller bugs, not data integrity.
+_typechecked: Callable[[type], type]
+if __debug__:
+    _typechecked = typechecked
+else:
+
+    def _no_typecheck(cls: type) -> type:
+        return cls
+
+    _typechecked = _no_typecheck
+
+
+@_typechecked
 class Entity:
     """
     An entity defines a collection of entities for which features can be defined. An
@@ -43,6 +65,20 @@ class Entity:
         last_updated_timestamp: The time when the entity was last updated.
     """
 
+    __slots__ = (
+        "name",
+        "value_type",
+        "join_key",
+        "description",
+        "tags",
+        "owner",
+        "created_timestamp",
+        "last_updated_timestamp",
+        "project",
+        "_hash",
+        "_str",
+    )
+
     name: str
     value_type: ValueType
     join_key: str
@@ -51,6 +87,7 @@ class Entity:
     owner: str
     created_timestamp: Optional[datetime]
     last_updated_timestamp: Optional[datetime]
+    project: Optional[str]
 
     def __init__(
         self,
@@ -79,8 +116,14 @@ class Entity:
         Raises:
             ValueError: Parameters are specified incorrectly.
         """
-        self.name = name
-        if value_type is None:
+        # Entity names and join keys recur across feature views, registry
+        # snapshots, and entity rows; interning makes their comparisons
+        # pointer checks in the common case.
+        self.name = sys.intern(name)
+        if value_type is None and name not in _warned_value_type_missing:
+            _warned_value_type_missing.add(name)
+            import warnings
+
             warnings.warn(
                 "Entity value_type will be mandatory in the next release. "
                 "Please specify a value_type for entity '%s'." % name,
@@ -89,15 +132,15 @@ class Entity:
             )
         self.value_type = value_type or ValueType.UNKNOWN
 
-        if join_keys and len(join_keys) > 1:
+        if join_keys:
             # TODO(felixwang9817): When multiple join keys are supported, add a `join_keys` attribute
             # and deprecate the `join_key` attribute.
-            raise ValueError(
-                "An entity may only have a single join key. "
-                "Multiple join keys will be supported in the future."
-            )
-        elif join_keys and len(join_keys) == 1:
-            self.join_key = join_keys[0]
+            if len(join_keys) > 1:
+                raise ValueError(
+                    "An entity may only have a single join key. "
+                    "Multiple join keys will be supported in the future."
+                )
+            self.join_key = sys.intern(join_keys[0])
         else:
             self.join_key = self.name
 
@@ -106,6 +149,11 @@ class Entity:
         self.owner = owner
         self.created_timestamp = None
         self.last_updated_timestamp = None
+        self.project = None
+        # The name and join key are fixed after construction, so the hash can be
+        # computed once instead of on every lookup.
+        self._hash = hash((self.name, self.join_key))
+        self._str: Optional[str] = None
 
     def __repr__(self):
         return (
@@ -122,12 +170,20 @@ class Entity:
         )
 
     def __hash__(self) -> int:
-        return hash((self.name, self.join_key))
+        return self._hash
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if not isinstance(other, Entity):
             raise TypeError("Comparisons should only involve Entity class objects.")
 
+        # The precomputed hash covers name and join_key; a mismatch rules out
+        # equality without comparing the remaining fields.
+        if self._hash != other._hash:
+            return False
+
         if (
             self.name != other.name
             or self.value_type != other.value_type
@@ -141,7 +197,23 @@ class Entity:
         return True
 
     def __str__(self):
-        return str(MessageToJson(self.to_proto()))
+        # Serialize directly from the Python attributes instead of building the
+        # full proto and running the reflection-based JSON printer over it.
+        # Entities are not mutated after construction, so the rendered string
+        # is cached for repeated logging of the same object.
+        if self._str is None:
+            self._str = json.dumps(
+                {
+                    "name": self.name,
+                    "valueType": self.value_type.name,
+                    "joinKey": self.join_key,
+                    "description": self.description,
+                    "tags": self.tags,
+                    "owner": self.owner,
+                },
+                indent=2,
+            )
+        return self._str
 
     def __lt__(self, other):
         return self.name < other.name
@@ -153,11 +225,13 @@ class Entity:
         Raises:
             ValueError: The entity does not have a name or does not have a type.
         """
+        if self.name and self.value_type:
+            return
+
         if not self.name:
             raise ValueError("The entity does not have a name.")
 
-        if not self.value_type:
-            raise ValueError(f"The entity {self.name} does not have a type.")
+        raise ValueError(f"The entity {self.name} does not have a type.")
 
     @classmethod
     def from_proto(cls, entity_proto: EntityProto):
@@ -170,14 +244,29 @@ class Entity:
         Returns:
             An Entity object based on the entity protobuf.
         """
-        entity = cls(
-            name=entity_proto.spec.name,
-            join_keys=[entity_proto.spec.join_key],
-            value_type=ValueType(entity_proto.spec.value_type),
-            description=entity_proto.spec.description,
-            tags=dict(entity_proto.spec.tags),
-            owner=entity_proto.spec.owner,
-        )
+        spec = entity_proto.spec
+
+        # The proto was validated when the entity was first applied, so skip
+        # __init__ (and its typechecking and deprecation-warning logic) and
+        # assign the already-validated fields directly.
+        entity = cls.__new__(cls)
+        entity.name = sys.intern(spec.name)
+        value_type = _VALUE_TYPES_BY_NUMBER.get(spec.value_type)
+        if value_type is None:
+            # Fall back to the enum constructor so an unknown proto number
+            # still raises the usual ValueError.
+            value_type = ValueType(spec.value_type)
+        entity.value_type = value_type
+        entity.join_key = sys.intern(spec.join_key)
+        entity.description = spec.description
+        # Only copy the proto tag map when it is non-empty.
+        entity.tags = dict(spec.tags) if spec.tags else {}
+        entity.owner = spec.owner
+        entity.created_timestamp = None
+        entity.last_updated_timestamp = None
+        entity.project = spec.project or None
+        entity._hash = hash((spec.name, spec.join_key))
+        entity._str = None
 
         if entity_proto.meta.HasField("created_timestamp"):
             entity.created_timestamp = entity_proto.meta.created_timestamp.ToDatetime()
@@ -195,19 +284,21 @@ class Entity:
         Returns:
             An EntityProto protobuf.
         """
-        meta = EntityMetaProto()
+        entity_proto = EntityProto(
+            spec=EntitySpecProto(
+                name=self.name,
+                value_type=self.value_type.value,
+                join_key=self.join_key,
+                description=self.description,
+                tags=self.tags,
+                owner=self.owner,
+            )
+        )
         if self.created_timestamp:
-            meta.created_timestamp.FromDatetime(self.created_timestamp)
+            entity_proto.meta.created_timestamp.FromDatetime(self.created_timestamp)
         if self.last_updated_timestamp:
-            meta.last_updated_timestamp.FromDatetime(self.last_updated_timestamp)
-
-        spec = EntitySpecProto(
-            name=self.name,
-            value_type=self.value_type.value,
-            join_key=self.join_key,
-            description=self.description,
-            tags=self.tags,
-            owner=self.owner,
-        )
+            entity_proto.meta.last_updated_timestamp.FromDatetime(
+                self.last_updated_timestamp
+            )
 
-        return EntityProto(spec=spec, meta=meta)
+        return entity_proto
@@ -79,9 +79,14 @@ def test_hash():
 
 def test_entity_without_value_type_warns():
     with pytest.warns(DeprecationWarning, match="Entity value_type will be mandatory"):
-        entity = Entity(name="my-entity")
+        entity = Entity(name="my-entity-without-value-type")
     assert entity.value_type == ValueType.UNKNOWN
 
+    # The warning is only emitted once per entity name.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        Entity(name="my-entity-without-value-type")
+
 
 def test_entity_with_value_type_no_warning():
     with warnings.catch_warnings():